@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+
+
+COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+
+class Asset(object):
+    def __init__(self, data, content_type, cache_control):
+        self.data = data
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.etag = '"{}"'.format(hashlib.sha1(data).hexdigest()[:16])
+        self.gzip = None
+        if content_type.startswith(COMPRESSIBLE):
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                self.gzip = compressed
+
+
+class AssetCache(object):
+    """ 启动时把网页用到的静态文件读入内存并预先压缩, 之后的请求不再访问磁盘
+
+    chart.html 映射到 / 和 /chart.html, static 目录下的文件映射到 /static/<name>
+    """
+
+    def __init__(self, root="."):
+        self.assets = {}
+        self.root = root
+
+        page = os.path.join(root, "chart.html")
+        if os.path.isfile(page):
+            self.add(("/", "/chart.html"), page, "no-cache")
+        else:
+            logging.error(f"{page} not found")
+
+        static = os.path.join(root, "static")
+        if os.path.isdir(static):
+            for name in sorted(os.listdir(static)):
+                path = os.path.join(static, name)
+                if not name.startswith(".") and os.path.isfile(path):
+                    self.add(("/static/" + name,), path, "public, max-age=86400")
+
+    def add(self, urls, path, cache_control):
+        with open(path, "rb") as f:
+            data = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/"):
+            content_type += ";charset=utf-8"
+        asset = Asset(data, content_type, cache_control)
+        for url in urls:
+            self.assets[url] = asset
+        logging.info(f"asset {path}: {len(data)} bytes, gzip {len(asset.gzip) if asset.gzip else '-'} bytes")
+
+    def get(self, url):
+        return self.assets.get(url)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import time
+
+import serial
+import serial.tools.list_ports
+
+import Board
+
+
+class AsyncCaliBoard(object):
+    """ 基于 asyncio 的板子客户端, 不占用线程, 一个事件循环可以同时服务多块板子
+
+    串口以非阻塞方式打开, 在支持的平台上通过 loop.add_reader 在有数据时读取,
+    否则(如 Windows 的 ProactorEventLoop)以 poll_interval 轮询.
+    每块板子同一时刻只有一条命令在执行. 超时抛出 asyncio.TimeoutError, 取消抛出 asyncio.CancelledError;
+    两种情况下迟到的应答都会被丢弃, 不会被当作下一条命令的应答.
+    """
+
+    def __init__(self, device, baudrate=115200, timeout=3.0, poll_interval=0.005):
+        self.device = device
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.port = None
+        self.loop = None
+        self.poll_task = None
+        self.lock = asyncio.Lock()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.buffer = b''
+        self.response = b''
+        self.waiter = None
+        self.subscribers = []
+
+    def __str__(self):
+        if self.port:
+            return "The board has been connected via {}".format(self.device)
+        else:
+            return "Not connected"
+
+    @staticmethod
+    def discover():
+        """ 返回所有可能是板子的串口设备名 """
+        return [comport.device for comport in serial.tools.list_ports.comports() if Board.is_board_port(comport)]
+
+    @classmethod
+    async def connect(cls, device, **kwargs):
+        """ 打开串口并确认是板子, 失败时抛出异常 """
+        board = cls(device, **kwargs)
+        await board.open()
+        try:
+            resp_type, firmware = await board.firmware()
+            if resp_type != Board.RESPONSE_DAT or Board.FIRMWARE_EXP.match(firmware.decode("utf-8")) is None:
+                raise serial.SerialException("{} is not a board: {}".format(device, firmware))
+        except BaseException:
+            await board.close()
+            raise
+        return board
+
+    @classmethod
+    async def connect_all(cls, **kwargs):
+        """ 并发打开所有找到的板子 """
+        results = await asyncio.gather(*(cls.connect(device, **kwargs) for device in cls.discover()),
+                                       return_exceptions=True)
+        boards = []
+        for result in results:
+            if isinstance(result, Exception):
+                logging.info(result)
+            else:
+                boards.append(result)
+        return boards
+
+    async def open(self):
+        self.loop = asyncio.get_running_loop()
+        self.port = serial.Serial(self.device, baudrate=self.baudrate, timeout=0)
+        try:
+            self.loop.add_reader(self.port.fileno(), self.on_readable)
+        except (NotImplementedError, AttributeError, ValueError):
+            self.poll_task = self.loop.create_task(self.poll())
+
+    async def close(self):
+        if self.port is None:
+            return
+        if self.poll_task is not None:
+            self.poll_task.cancel()
+            try:
+                await self.poll_task
+            except asyncio.CancelledError:
+                pass
+            self.poll_task = None
+        else:
+            self.loop.remove_reader(self.port.fileno())
+        self.port.close()
+        self.port = None
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_exception(serial.SerialException("port closed"))
+
+    async def poll(self):
+        while True:
+            self.on_readable()
+            await asyncio.sleep(self.poll_interval)
+
+    def subscribe(self, callback):
+        """ callback(t, sample, line) 在事件循环中被调用, 参见 Board.MultiFuncPort.subscribe """
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def on_readable(self):
+        try:
+            data = self.port.read(self.port.in_waiting or 1)
+        except serial.SerialException as ex:
+            logging.error(ex, exc_info=True)
+            if self.waiter is not None and not self.waiter.done():
+                self.waiter.set_exception(ex)
+            return
+        if not data:
+            return
+        self.buffer += data
+        while True:
+            end = self.buffer.find(b"\n")
+            if end < 0:
+                break
+            line = self.buffer[:end + 1]
+            self.buffer = self.buffer[end + 1:]
+            self.on_line(line)
+
+    def on_line(self, line):
+        if line.startswith((b"# ", b"% ")):
+            logging.info(line)
+            sample = Board.parse_telemetry(line)
+            if sample is not None:
+                t = time.time()
+                for callback in list(self.subscribers):
+                    try:
+                        callback(t, sample, line)
+                    except Exception as ex:
+                        logging.error(ex, exc_info=True)
+            return
+        if self.idle.is_set():
+            logging.info(f"discard {line}")
+            return
+        self.response += line
+        resp_type, pack_data = Board.decode(self.response)
+        if resp_type != Board.RESPONSE_BRN:
+            self.response = b''
+            self.idle.set()
+            if self.waiter is not None and not self.waiter.done():
+                self.waiter.set_result((resp_type, pack_data))
+
+    async def execute(self, cmd, timeout=None):
+        async with self.lock:
+            return await self.execute_locked(cmd, timeout)
+
+    async def execute_locked(self, cmd, timeout=None):
+        if self.port is None:
+            raise serial.SerialException("not connected")
+        if not self.idle.is_set():
+            # 上一条命令超时或被取消, 等它的应答到达后再发送, 最多等一小会
+            try:
+                await asyncio.wait_for(self.idle.wait(), 0.5)
+            except asyncio.TimeoutError:
+                logging.warning(f"discard partial response {self.response}")
+        self.response = b''
+        self.idle.clear()
+        self.waiter = self.loop.create_future()
+        try:
+            logging.info(cmd)
+            self.port.write(cmd)
+            return await asyncio.wait_for(self.waiter, self.timeout if timeout is None else timeout)
+        finally:
+            self.waiter = None
+
+    async def read_register(self, addr, timeout=None):
+        return await self.execute(Board.command_read_register(addr), timeout)
+
+    async def write_register(self, addr, value, timeout=None):
+        return await self.execute(Board.command_write_register(addr, value), timeout)
+
+    async def read_registers(self, addrs, timeout=None):
+        """ 连续读取多个寄存器, 期间不会插入其他命令 """
+        async with self.lock:
+            return [await self.execute_locked(Board.command_read_register(addr), timeout) for addr in addrs]
+
+    async def firmware(self, timeout=None):
+        return await self.execute(Board.command_firmware(), timeout)
+
+    async def reset(self, timeout=None):
+        return await self.execute(Board.command_reset(), timeout)
+
+    async def stream(self, interval, timeout=None):
+        return await self.execute(Board.command_stream(interval), timeout)
@@ -8,8 +8,12 @@ import time
 import serial
 import serial.tools.list_ports
 
+import collections
+import heapq
+import itertools
 import threading
-import queue
+
+import Profiler
 
 
 RESPONSE_OK = 0
@@ -17,6 +21,16 @@ RESPONSE_ERR = 1
 RESPONSE_DAT = 2
 RESPONSE_BRN = 3
 
+# 串口命令的优先级, 数值越小越优先
+PRIORITY_REALTIME = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BULK = 2
+
+PRIORITY_NAMES = {PRIORITY_REALTIME: "realtime", PRIORITY_INTERACTIVE: "interactive", PRIORITY_BULK: "bulk"}
+
+# 各优先级允许在队列中等待的时间(秒), 按 入队时间+等待时间 最早者先执行
+LATENCY_BUDGETS = {PRIORITY_REALTIME: 0.3, PRIORITY_INTERACTIVE: 0.1, PRIORITY_BULK: 2.0}
+
 
 def encode(value):
     if isinstance(value, bytes):
@@ -64,23 +78,131 @@ def decode(data):
         return RESPONSE_BRN, data
 
 
-p = re.compile("(\\d+\\.\\d+)C")
+FIRMWARE_EXP = re.compile("ver\\s+\\d.\\d,\\s+build\\s+\\S+")
+
+
+def is_board_port(comport):
+    # 是ST的Virtual Port Com
+    return comport.pid == 0x5740 and comport.vid == 0x0483
+
+
+def command_read_register(addr):
+    return encode(['read user data', struct.pack('B', addr)])
+
+
+def command_write_register(addr, value):
+    if isinstance(value, float):
+        return encode(['write user data', struct.pack('!Bf', addr | 0x80, value)])
+    return encode(['write user data', struct.pack('!BL', addr | 0x80, value & 0xFFFFFFFF)])
+
+
+def command_firmware():
+    return encode(['firmware'])
+
+
+def command_reset():
+    return encode(['reset'])
+
+
+def command_stream(interval):
+    return encode(['stream', struct.pack('!H', int(interval * 1000) & 0xFFFF)])
+
+
+class Command(object):
+    """ 排队等待串口线程执行的一条命令 """
+
+    def __init__(self, cmd, priority, seq):
+        self.cmd = cmd
+        self.priority = priority
+        self.seq = seq
+        self.enqueued = time.time()
+        self.deadline = self.enqueued + LATENCY_BUDGETS[priority]
+        self.evt = threading.Event()
+        self.rsp = (RESPONSE_ERR, "time out")
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class QueueStats(object):
+    """ 某个优先级的命令在队列中等待时间的统计 """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.over_budget = 0
+        self.recent = collections.deque(maxlen=256)
+
+    def add(self, wait):
+        self.count += 1
+        self.total += wait
+        self.max = max(self.max, wait)
+        if wait > self.budget:
+            self.over_budget += 1
+        self.recent.append(wait)
+
+    def summary(self):
+        recent = sorted(self.recent)
+        return {"count": self.count, "budget": self.budget,
+                "mean": self.total / self.count if self.count else 0, "max": self.max,
+                "p95": recent[int(len(recent) * 0.95)] if recent else 0, "over_budget": self.over_budget}
+
+
+p = re.compile("(-?\\d+\\.\\d+)C")
+TELEMETRY_EXP_KV = re.compile("([A-Za-z_]+)\\s*[:=]\\s*(-?\\d+(?:\\.\\d+)?)")
+TELEMETRY_ALIASES = {"to": "obj", "tobj": "obj", "te": "env", "tenv": "env"}
+# 固件上报的测量通道, 与 Store.CHANNELS 一致
+TELEMETRY_CHANNELS = ("obj", "env", "inf", "ntc", "ohm", "mv")
+
+
+def parse_telemetry(line):
+    """ 解析固件主动发出的 "# " / "% " 行, 返回 通道名->数值 的字典, 没有已知通道时返回 None
+
+    支持 "name: value" / "name=value" 的形式, 只保留 TELEMETRY_CHANNELS 中的通道及其别名,
+    其他的键(如 "# addr: 96")被忽略. 也支持只有温度的行(如 "# 25.10C 36.52C"),
+    此时按寄存器 0x60 的顺序依次为 env, obj
+    """
+    try:
+        text = line[2:].decode("utf-8").strip()
+    except UnicodeDecodeError:
+        return None
+    sample = {}
+    pairs = TELEMETRY_EXP_KV.findall(text)
+    for name, value in pairs:
+        name = name.lower()
+        name = TELEMETRY_ALIASES.get(name, name)
+        if name in TELEMETRY_CHANNELS:
+            sample[name] = float(value)
+    if not pairs:
+        for name, value in zip(("env", "obj"), p.findall(text)):
+            sample[name] = float(value)
+    return sample or None
 
 
 class MultiFuncPort(threading.Thread):
-    def __init__(self):
-        threading.Thread.__init__(self)
-        self.lock = threading.Lock()
-        self.evt_cmd = threading.Event()
-        self.evt_rsp = threading.Event()
+    def __init__(self, transport=None, recorder=None):
+        """ transport: 代替串口枚举, 返回一个类似 serial.Serial 的对象, 如 Session.ReplayPort
+        recorder: Session.SessionRecorder, 录制串口上的所有数据
+        """
+        threading.Thread.__init__(self, name="MultiFuncPort")
+        self.transport = transport
+        self.recorder = recorder
         self.shutdown = threading.Event()
 
-        self.cmd = None
-        self.rsp = None
+        # 等待执行的命令, 按截止时间排序
+        self.cond = threading.Condition()
+        self.queue = []
+        self.seq = itertools.count()
+        self.stats = {priority: QueueStats(budget) for priority, budget in LATENCY_BUDGETS.items()}
 
         self.port = None
         self.shutdown.clear()
 
+        self.subscribers = []
+
     def __str__(self):
         if self.port:
             return "{}".format(self.port.portstr)
@@ -89,25 +211,34 @@ class MultiFuncPort(threading.Thread):
 
     def disconnect(self):
         self.shutdown.set()
+        with self.cond:
+            self.cond.notify_all()
         self.join()
+        if self.recorder is not None:
+            self.recorder.close()
 
     def run(self):
-        self.evt_cmd.clear()
         while True:
             try:
                 while self.port:
                     if self.shutdown.is_set():
                         break
-                    if self.evt_cmd.is_set():
-                        self.evt_cmd.clear()
-                        self.rsp = self.__execute(self.cmd, self.port)
-                        self.evt_rsp.set()
-                    else:
+                    command = self.next_command()
+                    if command is not None:
+                        try:
+                            with Profiler.span("serial"):
+                                command.rsp = self.__execute(command.cmd, self.port)
+                        finally:
+                            command.evt.set()
+                    elif self.port.in_waiting:
                         line = self.port.readline()
-                        if line.startswith(b"# "):
-                            logging.info(line)
-                        elif line.startswith(b"% "):
-                            logging.info(line)
+                        if line.startswith((b"# ", b"% ")):
+                            self.on_telemetry(line)
+                    else:
+                        # 没有数据时在这里等待新命令, 命令入队后立刻被唤醒
+                        with self.cond:
+                            if not self.queue:
+                                self.cond.wait(0.01)
             except Exception as ex:
                 logging.info(ex, exc_info=True)
 
@@ -115,24 +246,40 @@ class MultiFuncPort(threading.Thread):
                 break
             self.connect()
 
-    def read_register(self, addr):
-        cmd = encode(['read user data', struct.pack('B', addr)])
-        return self.execute(cmd)
+    def subscribe(self, callback):
+        """ callback(t, sample, line) 在串口线程中被调用 """
+        self.subscribers.append(callback)
 
-    def write_register(self, addr, value):
-        if isinstance(value, float):
-            cmd = encode(['write user data', struct.pack('!Bf', addr | 0x80, value)])
-        else:
-            cmd = encode(['write user data', struct.pack('!BL', addr | 0x80, value & 0xFFFFFFFF)])
-        return self.execute(cmd)
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def on_telemetry(self, line):
+        logging.info(line)
+        sample = parse_telemetry(line)
+        if sample is None:
+            return
+        t = time.time()
+        for callback in list(self.subscribers):
+            try:
+                callback(t, sample, line)
+            except Exception as ex:
+                logging.error(ex, exc_info=True)
+
+    def read_register(self, addr, priority=PRIORITY_INTERACTIVE):
+        return self.execute(command_read_register(addr), priority)
+
+    def write_register(self, addr, value, priority=PRIORITY_INTERACTIVE):
+        return self.execute(command_write_register(addr, value), priority)
 
-    def firmware(self):
-        cmd = encode(['firmware'])
-        return self.execute(cmd)
+    def firmware(self, priority=PRIORITY_INTERACTIVE):
+        return self.execute(command_firmware(), priority)
 
-    def reset(self):
-        cmd = encode(['reset'])
-        return self.execute(cmd)
+    def stream(self, interval, priority=PRIORITY_INTERACTIVE):
+        """ 让固件每隔 interval 秒主动发送一次测量值, interval 为 0 时停止. 不支持的固件返回 RESPONSE_ERR """
+        return self.execute(command_stream(interval), priority)
+
+    def reset(self, priority=PRIORITY_INTERACTIVE):
+        return self.execute(command_reset(), priority)
 
     def connect(self):
         if self.port is not None:
@@ -144,14 +291,20 @@ class MultiFuncPort(threading.Thread):
                 pass
             self.port = None
 
+        if self.transport is not None:
+            self.open_transport()
+            return
+
         for comport in serial.tools.list_ports.comports():
             port = None
             try:
-                if comport.pid == 0x5740 and comport.vid == 0x0483:
+                if is_board_port(comport):
                     # 是ST的Virtual Port Com, 尝试打开串口，读取firmware信息
                     port = serial.Serial(comport.device, baudrate=115200, timeout=0.05)
+                    if self.recorder is not None:
+                        port = self.recorder.wrap(port)
                     firmware = self.who(port).decode("utf-8")
-                    if re.match(f"ver\\s+\\d.\\d,\\s+build\\s+\\S+", firmware) is not None:
+                    if FIRMWARE_EXP.match(firmware) is not None:
                         self.port = port
                         break
             except (ValueError, serial.SerialException) as ex:
@@ -167,27 +320,45 @@ class MultiFuncPort(threading.Thread):
         if port is None:
             time.sleep(5)
 
+    def open_transport(self):
+        try:
+            port = self.transport()
+            self.who(port)
+            self.port = port
+        except Exception as ex:
+            logging.error(str(ex), exc_info=True)
+            time.sleep(5)
+
     def who(self, port):
-        cmd = encode(['firmware'])
-        resp_type, pack_data = self.__execute(cmd, port)
+        resp_type, pack_data = self.__execute(command_firmware(), port)
         if resp_type == RESPONSE_DAT:
             logging.info(pack_data)
             return pack_data
         return b"-error, unknown firmware"
 
-    def execute(self, cmd):
-        with self.lock:
-            self.evt_rsp.clear()
-            self.cmd = cmd
-            self.rsp = (RESPONSE_ERR, "time out")
-            self.evt_cmd.set()
-            try:
-                self.evt_rsp.wait(10.0)
-                rsp = self.rsp
-            except Exception as ex:
-                logging.warning(ex, exc_info=True)
-                rsp = None
-        return rsp
+    def next_command(self):
+        with self.cond:
+            while self.queue:
+                command = heapq.heappop(self.queue)
+                if not command.cancelled:
+                    self.stats[command.priority].add(time.time() - command.enqueued)
+                    return command
+        return None
+
+    def execute(self, cmd, priority=PRIORITY_INTERACTIVE):
+        command = Command(cmd, priority, next(self.seq))
+        with self.cond:
+            heapq.heappush(self.queue, command)
+            self.cond.notify()
+        if not command.evt.wait(10.0):
+            command.cancelled = True
+        return command.rsp
+
+    def queue_stats(self):
+        with self.cond:
+            stats = {PRIORITY_NAMES[priority]: s.summary() for priority, s in self.stats.items()}
+            stats["queued"] = len(self.queue)
+        return stats
 
     def __execute(self, cmd, port=None):
         if port is None:
@@ -201,10 +372,8 @@ class MultiFuncPort(threading.Thread):
             if self.shutdown.is_set():
                 break
             data = port.readline(1024)
-            if data.startswith(b"# "):
-                logging.info(data)
-            elif data.startswith(b"% "):
-                logging.info(data)
+            if data.startswith((b"# ", b"% ")):
+                self.on_telemetry(data)
             elif len(data):
                 # logging.info(data)
                 response = response + data
@@ -217,8 +386,8 @@ class MultiFuncPort(threading.Thread):
 
 class CaliBoard(object):
 
-    def __init__(self):
-        self.port = MultiFuncPort()
+    def __init__(self, transport=None, recorder=None):
+        self.port = MultiFuncPort(transport, recorder)
         self.port.start()
 
     def __str__(self):
@@ -231,27 +400,26 @@ class CaliBoard(object):
     def disconnect(self):
         self.port.disconnect()
 
-    def read_register(self, addr):
-        return self.port.read_register(addr)
+    def read_register(self, addr, priority=PRIORITY_INTERACTIVE):
+        return self.port.read_register(addr, priority)
+
+    def write_register(self, addr, value, priority=PRIORITY_INTERACTIVE):
+        return self.port.write_register(addr, value, priority)
+
+    def firmware(self, priority=PRIORITY_INTERACTIVE):
+        return self.port.firmware(priority)
 
-    def write_register(self, addr, value):
-        return self.port.write_register(addr, value)
+    def reset(self, priority=PRIORITY_INTERACTIVE):
+        return self.port.reset(priority)
 
-    def firmware(self):
-        return self.port.firmware()
+    def stream(self, interval, priority=PRIORITY_INTERACTIVE):
+        return self.port.stream(interval, priority)
 
-    def reset(self):
-        return self.port.reset()
+    def queue_stats(self):
+        return self.port.queue_stats()
 
+    def subscribe(self, callback):
+        self.port.subscribe(callback)
 
-if __name__ == '__main__':
-    # reset_chip()
-    # save_cali_params()
-    # reset_post_cali_params()
-    # test_measure()
-    # test_iic_addr()
-    board = CaliBoard()
-    board.connect()
-    board.read_user_data(0x70)
-    board.read_user_data(0x71)
-    board.measure_env_raw()
+    def unsubscribe(self, callback):
+        self.port.unsubscribe(callback)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+
+MAX_SECONDS = 60
+
+# 正在采集时才记录 span, 平时 span() 只判断一次这个标志
+_tracing = False
+_spans = []
+_capture_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+class _NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter()
+        _spans.append((self.name, threading.get_ident(), self.start, end))
+        return False
+
+
+def span(name):
+    """ with Profiler.span("measure"): ... 记录一段耗时, 没有在采集时几乎没有开销 """
+    if not _tracing:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return "{}:{}".format(os.path.basename(code.co_filename), code.co_name)
+
+
+def capture(seconds, interval=0.005):
+    """ 在 seconds 秒内定时对所有线程的调用栈采样
+
+    返回 (collapsed, trace): collapsed 是 flamegraph.pl / speedscope 可以读取的折叠调用栈文本,
+    trace 是 Chrome trace event 格式的 span 记录. 同一时刻只允许一个采集, 否则抛出 ProfilerBusy
+    """
+    global _tracing, _spans
+    seconds = min(max(float(seconds), 0.1), MAX_SECONDS)
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfilerBusy("a profile is being captured")
+    try:
+        _spans = []
+        _tracing = True
+        me = threading.get_ident()
+        stacks = collections.Counter()
+        names = {}
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            names.update((t.ident, t.name) for t in threading.enumerate())
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)).replace(";", ":"))
+                stacks[";".join(reversed(stack))] += 1
+            time.sleep(interval)
+        _tracing = False
+        spans = _spans
+        _spans = []
+    finally:
+        _tracing = False
+        _capture_lock.release()
+
+    collapsed = "".join("{} {}\n".format(stack, count) for stack, count in sorted(stacks.items()))
+    pid = os.getpid()
+    events = [{"name": name, "ph": "X", "pid": pid, "tid": tid, "ts": (t0 - start) * 1e6, "dur": (t1 - t0) * 1e6}
+              for name, tid, t0, t1 in spans]
+    events.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in names.items())
+    return collapsed, json.dumps({"traceEvents": events})
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+import array
+import bisect
+import math
+import threading
+import time
+
+
+# (分辨率秒数, 保留的秒数), None 表示一直保留
+LEVELS = ((10, 2 * 86400), (60, 14 * 86400), (600, 180 * 86400), (3600, None))
+
+
+def combine_tile(tile, other):
+    """ 把 other 的 min/max/sum/count 合并到 tile """
+    for offset in range(0, len(tile), 4):
+        if other[offset] < tile[offset]:
+            tile[offset] = other[offset]
+        if other[offset + 1] > tile[offset + 1]:
+            tile[offset + 1] = other[offset + 1]
+        tile[offset + 2] += other[offset + 2]
+        tile[offset + 3] += other[offset + 3]
+
+
+def rollup(keys, tiles, resolution, coarse):
+    """ 把 resolution 秒的瓦片合并成 coarse 秒的瓦片, coarse 必须是 resolution 的整数倍 """
+    coarse_keys, coarse_tiles = [], []
+    for key, tile in zip(keys, tiles):
+        key = key * resolution // coarse
+        if coarse_keys and coarse_keys[-1] == key:
+            combine_tile(coarse_tiles[-1], tile)
+        else:
+            coarse_keys.append(key)
+            coarse_tiles.append(array.array('d', tile))
+    return coarse_keys, coarse_tiles
+
+
+class TileLevel(object):
+    """ 某个分辨率下的全部瓦片, 按时间排序
+
+    每个瓦片是一个 array('d'), 每个通道依次占 min, max, sum, count 四个位置
+    """
+
+    def __init__(self, resolution, retention, channels):
+        self.resolution = resolution
+        self.retention = retention
+        self.channels = channels
+        self.keys = []
+        self.tiles = []
+
+    def new_tile(self):
+        return array.array('d', (math.inf, -math.inf, 0, 0) * len(self.channels))
+
+    def append(self, t, values):
+        key = int(t // self.resolution)
+        if self.keys and self.keys[-1] == key:
+            tile = self.tiles[-1]
+        elif not self.keys or self.keys[-1] < key:
+            tile = self.new_tile()
+            self.keys.append(key)
+            self.tiles.append(tile)
+            self.trim(key)
+        else:
+            # 早于最新瓦片的数据, 只在从数据库加载历史时出现
+            i = bisect.bisect_left(self.keys, key)
+            if i < len(self.keys) and self.keys[i] == key:
+                tile = self.tiles[i]
+            else:
+                tile = self.new_tile()
+                self.keys.insert(i, key)
+                self.tiles.insert(i, tile)
+
+        for n, channel in enumerate(self.channels):
+            v = values.get(channel)
+            if v is None:
+                continue
+            offset = n * 4
+            if v < tile[offset]:
+                tile[offset] = v
+            if v > tile[offset + 1]:
+                tile[offset + 1] = v
+            tile[offset + 2] += v
+            tile[offset + 3] += 1
+
+    def merge(self, keys, tiles):
+        """ 并入从数据库加载的瓦片, 它们早于(或最多与第一个)采集到的瓦片重叠 """
+        i = bisect.bisect_left(keys, self.keys[0]) if self.keys else len(keys)
+        for key, tile in zip(keys[i:], tiles[i:]):
+            self.combine(key, tile)
+        self.keys[:0] = keys[:i]
+        self.tiles[:0] = tiles[:i]
+        if self.keys:
+            self.trim(self.keys[-1])
+
+    def combine(self, key, other):
+        i = bisect.bisect_left(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            self.keys.insert(i, key)
+            self.tiles.insert(i, other)
+            return
+        combine_tile(self.tiles[i], other)
+
+    def trim(self, key):
+        if self.retention is None:
+            return
+        keep = self.retention // self.resolution
+        # 超出保留时间 10% 后再一次性裁剪, 避免每次都移动整个列表
+        if len(self.keys) > keep * 1.1 and self.keys[0] < key - keep:
+            i = bisect.bisect_left(self.keys, key - keep)
+            del self.keys[:i]
+            del self.tiles[:i]
+
+    def query(self, t0, t1, channels):
+        i = bisect.bisect_left(self.keys, int(t0 // self.resolution))
+        j = bisect.bisect_right(self.keys, int(t1 // self.resolution))
+        result = {"ts": [(k + 0.5) * self.resolution for k in self.keys[i:j]]}
+        for channel in channels:
+            offset = self.channels.index(channel) * 4
+            lows, highs, means = [], [], []
+            for tile in self.tiles[i:j]:
+                count = tile[offset + 3]
+                if count:
+                    lows.append(tile[offset])
+                    highs.append(tile[offset + 1])
+                    means.append(tile[offset + 2] / count)
+                else:
+                    lows.append(None)
+                    highs.append(None)
+                    means.append(None)
+            result[channel] = {"min": lows, "max": highs, "mean": means}
+        return result
+
+
+class TilePyramid(object):
+    """ 多分辨率的 min/max/mean 索引, 每个采样以 O(层数) 的代价增量更新
+
+    查询时选取能在 max_points 个点内覆盖整个时间范围, 并且保留时间仍覆盖查询起点的最细的一层.
+    """
+
+    def __init__(self, channels, levels=LEVELS):
+        self.channels = tuple(channels)
+        self.lock = threading.Lock()
+        self.levels = [TileLevel(resolution, retention, self.channels) for resolution, retention in levels]
+        # 最新采样的时间, 保留时间相对它计算, 与 TileLevel.trim 一致
+        self.latest = None
+
+    def append(self, t, values):
+        with self.lock:
+            if self.latest is None or t > self.latest:
+                self.latest = t
+            for level in self.levels:
+                level.append(t, values)
+
+    def load(self, store, t_to):
+        """ 由 store(Store.SampleStore) 中早于 t_to 的数据重建索引, t_to 之后的采样应当经由 append 加入
+
+        每一层只读取保留时间以内的数据, 并在 sqlite 中按瓦片聚合. 上一层已经读取过的时间段
+        由上一层的瓦片合并得到, 所以每个采样只被读取一次. 只在并入每一层时短暂持有锁
+        """
+        finer, finer_keys, finer_tiles = None, [], []
+        t_end = t_to
+        for level in self.levels:
+            if finer is not None and (level.resolution % finer.resolution or t_end is None):
+                # 分辨率不是上一层的整数倍, 只能直接读取整个保留时间
+                finer, t_end = None, t_to
+            t_from = None
+            if level.retention is not None:
+                # 从整瓦片开始, 保留时间边界上的瓦片也是完整的
+                t_from = min((t_to - level.retention) // level.resolution * level.resolution, t_end)
+            keys, tiles = self.read_tiles(store, level, t_from, t_end)
+            if finer is not None:
+                finer_keys, finer_tiles = rollup(finer_keys, finer_tiles, finer.resolution, level.resolution)
+                if keys and finer_keys and keys[-1] == finer_keys[0]:
+                    # 两段在同一个瓦片内衔接
+                    combine_tile(finer_tiles[0], tiles.pop())
+                    keys.pop()
+                keys.extend(finer_keys)
+                tiles.extend(finer_tiles)
+            finer, finer_keys, finer_tiles = level, keys, tiles
+            t_end = t_from
+            with self.lock:
+                level.merge(list(keys), [array.array('d', tile) for tile in tiles])
+
+    def read_tiles(self, store, level, t_from, t_to):
+        keys, tiles = [], []
+        for row in store.tiles(level.resolution, t_from, t_to, self.channels):
+            tile = level.new_tile()
+            for offset, (low, high, total, count) in enumerate(zip(*[iter(row[1:])] * 4)):
+                if count:
+                    tile[offset * 4: offset * 4 + 4] = array.array('d', (low, high, total, count))
+            keys.append(row[0])
+            tiles.append(tile)
+        return keys, tiles
+
+    def level_for(self, t0, t1, max_points):
+        now = time.time() if self.latest is None else self.latest
+        for level in self.levels:
+            if level.retention is not None and t0 < now - level.retention:
+                continue
+            if (t1 - t0) / level.resolution <= max_points:
+                return level
+        return self.levels[-1]
+
+    def query(self, t0, t1, max_points=2000, channels=None):
+        if channels is None:
+            channels = self.channels
+        with self.lock:
+            level = self.level_for(t0, t1, max_points)
+            result = level.query(t0, t1, channels)
+        result["resolution"] = level.resolution
+        return result
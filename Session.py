@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+import argparse
+import collections
+import datetime
+import logging
+import os
+import struct
+import threading
+import time
+
+
+# 文件格式: 文件头 + 记录, 全部小端
+# 文件头: magic(7s) version(B) 开始时间(d)
+# 记录: 相对开始时间的秒数(d) 方向(B) 长度(H) 数据
+MAGIC = b"ELIMREC"
+VERSION = 1
+HEAD = struct.Struct("<7sBd")
+RECORD = struct.Struct("<dBH")
+
+TX = 0
+RX = 1
+
+
+class SessionRecorder(object):
+    """ 把串口上收发的原始字节连同时间戳写入文件, 用 wrap() 包装串口对象
+
+    文件名中加入开始录制的时间, 如 session.rec 实际写入 session-20200101-120000.rec,
+    重新启动程序不会覆盖上一次的录制; 文件已经存在时抛出 FileExistsError
+    """
+
+    def __init__(self, path):
+        self.start = time.time()
+        root, ext = os.path.splitext(path)
+        self.path = "{}-{}{}".format(root, time.strftime("%Y%m%d-%H%M%S", time.localtime(self.start)), ext)
+        self.lock = threading.Lock()
+        self.last_flush = self.start
+        self.file = open(self.path, "xb")
+        logging.info(f"recording serial session to {self.path}")
+        self.file.write(HEAD.pack(MAGIC, VERSION, self.start))
+
+    def wrap(self, port):
+        return RecordingPort(port, self)
+
+    def record(self, direction, data):
+        with self.lock:
+            if self.file.closed:
+                return
+            t = time.time()
+            for offset in range(0, len(data), 0xFFFF):
+                chunk = data[offset: offset + 0xFFFF]
+                self.file.write(RECORD.pack(t - self.start, direction, len(chunk)))
+                self.file.write(chunk)
+            if t - self.last_flush > 1:
+                self.file.flush()
+                self.last_flush = t
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class RecordingPort(object):
+    """ 代替 serial.Serial 使用, 所有读写都被记录 """
+
+    def __init__(self, port, recorder):
+        self.port = port
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self.port, name)
+
+    def write(self, data):
+        self.recorder.record(TX, data)
+        return self.port.write(data)
+
+    def readline(self, size=-1):
+        data = self.port.readline(size)
+        if data:
+            self.recorder.record(RX, data)
+        return data
+
+    def read(self, size=1):
+        data = self.port.read(size)
+        if data:
+            self.recorder.record(RX, data)
+        return data
+
+
+def records(path):
+    """ 逐条产生 (相对时间, 方向, 数据) , 不把整个文件读入内存 """
+    with open(path, "rb") as f:
+        magic, version, start = HEAD.unpack(f.read(HEAD.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a recorded session".format(path))
+        while True:
+            head = f.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+            t, direction, size = RECORD.unpack(head)
+            yield t, direction, f.read(size)
+
+
+class ReplayPort(object):
+    """ 代替 serial.Serial 使用, 回放录制的会话
+
+    write 在接下来的 lookahead 条记录中找到与写入数据相同的发送记录, 它之后直到下一条发送记录的数据
+    就是这条命令的应答, 由 readline 依次返回. 这样即使回放时命令的顺序与录制时不同(如快速回放时
+    各寄存器的读取间隔不同), 命令和应答仍然对应; 找不到时返回错误应答, 而不是别的命令的应答.
+    没有待返回的应答时, readline 返回录制文件中排在最前面的未读数据(固件主动发送的行),
+    轮到一条还没有写入的发送记录时像串口超时一样返回 b"".
+    realtime 为 True 时按录制时的节奏返回数据, 否则尽可能快地回放.
+    录制的数据全部用完, 或者读完文件后仍有命令找不到应答时, finished 被设置, elapsed 为回放用去的秒数.
+    """
+
+    MISMATCH = b"-replay mismatch\r\n"
+
+    def __init__(self, path, realtime=True, timeout=0.05, lookahead=256):
+        self.path = path
+        self.realtime = realtime
+        self.timeout = timeout
+        self.lookahead = lookahead
+        self.portstr = "replay:{}".format(path)
+        self.records = records(path)
+        # 已从文件读出但还没有用掉的记录, 以及最近一条命令的应答
+        self.ahead = collections.deque()
+        self.replies = collections.deque()
+        self.exhausted = False
+        # 回放中已经应答过的命令, 再次写入却找不到记录说明录制的数据用完了
+        self.answered = set()
+        self.start = time.time()
+        self.offset = self.ahead[0][0] if self.fetch() else 0
+        self.elapsed = None
+        self.finished = threading.Event()
+
+    def fetch(self):
+        record = None if self.exhausted else next(self.records, None)
+        if record is None:
+            self.exhausted = True
+        else:
+            self.ahead.append(record)
+        return record
+
+    def peek(self):
+        """ 下一条可以由 readline 返回的记录, 没有时返回 None """
+        if self.replies:
+            return self.replies[0]
+        if not self.ahead:
+            self.fetch()
+        if self.ahead and self.ahead[0][1] == RX:
+            return self.ahead[0]
+        return None
+
+    def consume(self):
+        if self.replies:
+            self.replies.popleft()
+        else:
+            self.ahead.popleft()
+        self.check_finished()
+
+    def check_finished(self, ran_out=False):
+        """ 文件已经读完, 没有待返回的数据, 并且剩下的记录中没有命令, 或者录制过的命令已经用完时, 回放结束 """
+        if not self.exhausted or self.finished.is_set() or self.peek() is not None:
+            return
+        if ran_out or not any(record[1] == TX for record in self.ahead):
+            self.elapsed = time.time() - self.start
+            logging.info(f"{self.path} replayed in {self.elapsed:.3f}s")
+            self.finished.set()
+
+    def find(self, data):
+        """ 在未读记录中查找与 data 相同的发送记录, 最多向后读取 lookahead 条, 返回其下标或 None """
+        i = 0
+        fetched = 0
+        while True:
+            while i < len(self.ahead):
+                if self.ahead[i][1] == TX and self.ahead[i][2] == data:
+                    return i
+                i += 1
+            if fetched >= self.lookahead or self.fetch() is None:
+                return None
+            fetched += 1
+            if len(self.ahead) > self.lookahead:
+                # 太久没有被写入的命令和它的应答不会再用到了
+                self.ahead.popleft()
+                i -= 1
+
+    def write(self, data):
+        # 上一条命令没有读完的应答作废, 只保留其中固件主动发送的行
+        self.replies = collections.deque(r for r in self.replies if r[2].startswith((b"# ", b"% ")))
+        i = self.find(data)
+        if i is None:
+            self.check_finished(data in self.answered)
+            if not self.finished.is_set():
+                logging.warning(f"replay has no record of {data} being written")
+            self.replies.append((time.time() - self.start + self.offset, RX, self.MISMATCH))
+            return len(data)
+        del self.ahead[i]
+        self.answered.add(data)
+        while True:
+            if i == len(self.ahead) and self.fetch() is None:
+                break
+            if self.ahead[i][1] != RX:
+                break
+            self.replies.append(self.ahead[i])
+            del self.ahead[i]
+        return len(data)
+
+    @property
+    def in_waiting(self):
+        record = self.peek()
+        if record is None:
+            return 0
+        if self.realtime and self.start + record[0] - self.offset > time.time():
+            return 0
+        return len(record[2])
+
+    def readline(self, size=-1):
+        record = self.peek()
+        if record is None:
+            time.sleep(self.timeout if self.realtime or self.exhausted else 0.001)
+            return b""
+        if self.realtime:
+            delay = self.start + record[0] - self.offset - time.time()
+            if delay > self.timeout:
+                time.sleep(self.timeout)
+                return b""
+            if delay > 0:
+                time.sleep(delay)
+        self.consume()
+        return record[2]
+
+    def close(self):
+        self.records.close()
+
+
+def dump(path):
+    for t, direction, data in records(path):
+        print("{:12.6f} {} {}".format(t, "TX" if direction == TX else "RX", data))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show a serial session recorded by ElimDesktop")
+    parser.add_argument("path", help="recorded session file")
+    args = parser.parse_args(argv)
+    with open(args.path, "rb") as f:
+        magic, version, start = HEAD.unpack(f.read(HEAD.size))
+    print("recorded at {}".format(datetime.datetime.fromtimestamp(start)))
+    dump(args.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import collections
+import math
+
+
+WINDOWS = (10, 60, 600)
+
+
+class RollingWindow(object):
+    """ 最近 seconds 秒内的均值, 标准差, 最小/最大值和漂移斜率(最小二乘, 单位/秒)
+
+    每个采样的更新代价为均摊 O(1): 累加和随进出窗口增减, 最小/最大值用单调队列.
+    为避免累加和的舍入误差, 每加入与窗口等长数量的采样后, 以窗口中第一个点为基准重新计算一次累加和.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.samples = collections.deque()
+        self.lows = collections.deque()
+        self.highs = collections.deque()
+        self.t0 = 0.0
+        self.x0 = 0.0
+        self.since_rebase = 0
+        self.st = self.sx = self.stt = self.sxx = self.stx = 0.0
+
+    def add(self, t, x):
+        if not self.samples:
+            # 以第一个点为基准, 否则在第一次 rebase 之前 Unix 时间戳的平方和会抵消掉全部有效数字
+            self.t0, self.x0 = t, x
+        self.samples.append((t, x))
+        self.accumulate(t, x, 1)
+        while self.lows and self.lows[-1][1] >= x:
+            self.lows.pop()
+        self.lows.append((t, x))
+        while self.highs and self.highs[-1][1] <= x:
+            self.highs.pop()
+        self.highs.append((t, x))
+
+        while self.samples[0][0] <= t - self.seconds:
+            old_t, old_x = self.samples.popleft()
+            self.accumulate(old_t, old_x, -1)
+        while self.lows[0][0] <= t - self.seconds:
+            self.lows.popleft()
+        while self.highs[0][0] <= t - self.seconds:
+            self.highs.popleft()
+
+        self.since_rebase += 1
+        if self.since_rebase >= max(len(self.samples), 64):
+            self.rebase()
+
+    def accumulate(self, t, x, sign):
+        t -= self.t0
+        x -= self.x0
+        self.st += sign * t
+        self.sx += sign * x
+        self.stt += sign * t * t
+        self.sxx += sign * x * x
+        self.stx += sign * t * x
+
+    def rebase(self):
+        self.t0, self.x0 = self.samples[0]
+        self.st = self.sx = self.stt = self.sxx = self.stx = 0.0
+        for t, x in self.samples:
+            self.accumulate(t, x, 1)
+        self.since_rebase = 0
+
+    def summary(self):
+        n = len(self.samples)
+        if n == 0:
+            return {"n": 0}
+        mean = self.sx / n
+        result = {"n": n, "mean": self.x0 + mean, "min": self.lows[0][1], "max": self.highs[0][1],
+                  "std": 0.0, "slope": 0.0}
+        if n > 1:
+            result["std"] = math.sqrt(max(0.0, (self.sxx - self.sx * mean) / (n - 1)))
+            d = n * self.stt - self.st * self.st
+            if d > 0:
+                result["slope"] = (n * self.stx - self.st * self.sx) / d
+        return result
+
+
+class StatsEngine(object):
+    """ 每个通道, 每个窗口一个 RollingWindow """
+
+    def __init__(self, channels, windows=WINDOWS):
+        self.windows = tuple(windows)
+        self.channels = {channel: [RollingWindow(w) for w in self.windows] for channel in channels}
+
+    def add(self, t, values):
+        for channel, windows in self.channels.items():
+            x = values.get(channel)
+            if x is None:
+                continue
+            for window in windows:
+                window.add(t, x)
+
+    def summary(self):
+        """ {通道: {"10s": {n, mean, std, min, max, slope}, ...}} """
+        return {channel: {"{}s".format(w.seconds): w.summary() for w in windows}
+                for channel, windows in self.channels.items()}
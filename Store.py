@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import argparse
+import datetime
+import sqlite3
+import struct
+import sys
+import threading
+import time
+
+
+CHANNELS = ("obj", "env", "inf", "ntc", "ohm", "mv")
+
+EXPORT_CSV = "csv"
+EXPORT_BIN = "bin"
+
+# 二进制导出格式: 文件头 + 定长记录, 全部小端
+# 文件头: magic(4s) version(B) 通道数(B), 随后每个通道名以 长度(B)+utf-8 表示
+# 记录: 时间戳(d) + 每个通道一个 double, 缺失值为 NaN
+BIN_MAGIC = b"ELIM"
+BIN_VERSION = 1
+
+
+def parse_time(text):
+    """ 接受 unix 时间戳或 ISO 格式的时间, 返回 unix 时间戳 """
+    if text is None:
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.datetime.fromisoformat(text).timestamp()
+
+
+def parse_channels(text):
+    if not text:
+        return list(CHANNELS)
+    channels = [c.strip() for c in text.split(",") if c.strip()]
+    for c in channels:
+        if c not in CHANNELS:
+            raise ValueError("unknown channel {}".format(c))
+    return channels
+
+
+class SampleStore(object):
+    """ 采样数据的持久化存储, 基于 sqlite
+
+    写入只发生在采集线程, 读取(导出)的每个调用方使用自己的连接, 以 WAL 模式打开,
+    读者不会阻塞采集线程. 写入每 commit_interval 秒或 commit_rows 行提交一次, 而不是每行都同步到磁盘.
+    """
+
+    def __init__(self, path, commit_interval=1.0, commit_rows=256):
+        self.path = path
+        self.commit_interval = commit_interval
+        self.commit_rows = commit_rows
+        self.uncommitted = 0
+        self.last_commit = time.time()
+        self.lock = threading.Lock()
+        self.conn = self.open()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL 模式下 NORMAL 只在检查点时同步, 掉电最多丢失最近的提交, 数据库不会损坏
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS samples (ts REAL PRIMARY KEY, {})".format(
+            ", ".join("{} REAL".format(c) for c in CHANNELS)))
+        self.conn.commit()
+
+    def open(self):
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+    def append(self, ts, values):
+        """ values 是 通道名->数值 的字典, 未采样的通道缺省为 NULL """
+        row = [ts] + [values.get(c) for c in CHANNELS]
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO samples VALUES ({})".format(", ".join("?" * len(row))), row)
+            self.uncommitted += 1
+            t = time.time()
+            if self.uncommitted >= self.commit_rows or t - self.last_commit >= self.commit_interval:
+                self.conn.commit()
+                self.uncommitted = 0
+                self.last_commit = t
+
+    def rows(self, t_from=None, t_to=None, channels=CHANNELS, batch=1024):
+        """ 按时间顺序逐行产生 (ts, v0, v1...) , 内存占用与数据量无关 """
+        sql = "SELECT ts, {} FROM samples WHERE ts >= ? AND ts <= ? ORDER BY ts".format(", ".join(channels))
+        conn = self.open()
+        try:
+            cursor = conn.execute(sql, (t_from if t_from is not None else float("-inf"),
+                                        t_to if t_to is not None else float("inf")))
+            while True:
+                rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+    def tiles(self, resolution, t_from=None, t_to=None, channels=CHANNELS):
+        """ 按 resolution 秒分组聚合 t_from <= ts < t_to 的数据, 在 sqlite 中完成
+
+        按时间顺序逐个产生 (分组序号, 每个通道依次 min, max, sum, count) , 分组序号为 int(ts // resolution),
+        某个通道在分组内没有数据时 min/max 为 None, count 为 0
+        """
+        columns = ", ".join("MIN({0}), MAX({0}), TOTAL({0}), COUNT({0})".format(c) for c in channels)
+        sql = "SELECT CAST(ts / ? AS INTEGER) AS k, {} FROM samples WHERE ts >= ? AND ts < ? GROUP BY k ORDER BY k".format(
+            columns)
+        conn = self.open()
+        try:
+            yield from conn.execute(sql, (resolution, t_from if t_from is not None else float("-inf"),
+                                          t_to if t_to is not None else float("inf")))
+        finally:
+            conn.close()
+
+    def export(self, fmt, t_from=None, t_to=None, channels=CHANNELS):
+        """ 以 bytes 块的形式产生导出内容 """
+        if fmt == EXPORT_CSV:
+            return self.export_csv(self.rows(t_from, t_to, channels), channels)
+        elif fmt == EXPORT_BIN:
+            return self.export_bin(self.rows(t_from, t_to, channels), channels)
+        raise ValueError("unknown format {}".format(fmt))
+
+    @staticmethod
+    def export_csv(rows, channels, chunk_size=64 * 1024):
+        chunk = [",".join(("ts",) + tuple(channels)) + "\r\n"]
+        size = 0
+        for row in rows:
+            line = ",".join("" if v is None else repr(v) for v in row) + "\r\n"
+            chunk.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
+                size = 0
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
+
+    @staticmethod
+    def export_bin(rows, channels, chunk_size=64 * 1024):
+        head = [struct.pack("<4sBB", BIN_MAGIC, BIN_VERSION, len(channels))]
+        for c in channels:
+            name = c.encode("utf-8")
+            head.append(struct.pack("<B", len(name)) + name)
+        yield b"".join(head)
+
+        record = struct.Struct("<d" + "d" * len(channels))
+        nan = float("nan")
+        chunk = bytearray()
+        for row in rows:
+            chunk += record.pack(*(nan if v is None else v for v in row))
+            if len(chunk) >= chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export samples recorded by ElimDesktop")
+    parser.add_argument("--db", default="elim.db", help="sample database, default elim.db")
+    parser.add_argument("--from", dest="t_from", help="start time, unix timestamp or ISO format")
+    parser.add_argument("--to", dest="t_to", help="end time, unix timestamp or ISO format")
+    parser.add_argument("--format", default=EXPORT_CSV, choices=(EXPORT_CSV, EXPORT_BIN))
+    parser.add_argument("--channels", help="comma separated channels, default all: " + ",".join(CHANNELS))
+    parser.add_argument("-o", "--output", help="output file, default stdout")
+    args = parser.parse_args(argv)
+
+    store = SampleStore(args.db)
+    try:
+        chunks = store.export(args.format, parse_time(args.t_from), parse_time(args.t_to),
+                              parse_channels(args.channels))
+        if args.output:
+            with open(args.output, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1 @@
-C:\Python37\Scripts\pyinstaller.exe -n Elim --add-data chart.html;. main.py
\ No newline at end of file
+C:\Python37\Scripts\pyinstaller.exe -n Elim --add-data chart.html;. --add-data static;static main.py
\ No newline at end of file
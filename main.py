@@ -1,6 +1,6 @@
 import array
 import binascii
-import copy
+import collections
 import datetime
 import json
 import logging
@@ -11,7 +11,7 @@ import sys, os, random
 import threading
 import time
 import re
-from http.server import HTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
 import http
 import urllib
 
@@ -28,7 +28,13 @@ from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 import matplotlib.dates as mdates
 
+import Assets
 import Board
+import Profiler
+import Pyramid
+import Session
+import Stats
+import Store
 
 matplotlib.use('Qt5Agg')
 
@@ -42,10 +48,13 @@ class MyHTTPRequestHandler(SimpleHTTPRequestHandler):
         self.path = r.path
         queries = urllib.parse.parse_qs(r.query)
         handlers = {'/measure': self.on_measure, '/program': self.on_program, "/unlock": self.on_unlock,
-                    "/register": self.on_register, '/data': self.on_data}
+                    "/register": self.on_register, '/data': self.on_data, '/export': self.on_export,
+                    '/queue': self.on_queue, '/debug/profile': self.on_profile,
+                    '/stats': self.on_stats}
         f = handlers.get(self.path, None)
         if f:
-            f(queries)
+            with Profiler.span("http " + self.path):
+                f(queries)
             return
 
         if self.path == r'/watch':
@@ -57,12 +66,41 @@ class MyHTTPRequestHandler(SimpleHTTPRequestHandler):
             self.wfile.write(json_text.encode("utf-8"))
             return
 
-        f = self.send_head()
-        if f:
-            try:
-                self.copyfile(f, self.wfile)
-            finally:
-                f.close()
+        self.send_asset()
+
+    def do_HEAD(self):
+        """Serve a HEAD request."""
+        self.path = urllib.parse.urlparse(self.path).path
+        self.send_asset(head_only=True)
+
+    def send_asset(self, head_only=False):
+        asset = self.server.assets.get(self.path)
+        if asset is None:
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        if asset.etag in [x.strip() for x in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(http.HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Cache-Control", asset.cache_control)
+            self.end_headers()
+            return
+
+        body = asset.data
+        gzipped = asset.gzip is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = asset.gzip
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", asset.etag)
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
 
     def on_measure(self, queries):
         board = self.server.owner.board
@@ -117,13 +155,91 @@ class MyHTTPRequestHandler(SimpleHTTPRequestHandler):
     def on_data(self, queries):
         board = self.server.owner.board
 
-        json_text = json.dumps(board.data())
+        json_text = board.json_data()
         self.send_response(http.HTTPStatus.OK)
         self.send_header("Content-type", "application/json;charset=utf-8")
         self.send_header("Content-Length", str(len(json_text)))
         self.end_headers()
         self.wfile.write(json_text.encode("utf-8"))
 
+    def on_stats(self, queries):
+        board = self.server.owner.board
+
+        json_text = json.dumps(board.stats)
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(json_text)))
+        self.end_headers()
+        self.wfile.write(json_text.encode("utf-8"))
+
+    def on_queue(self, queries):
+        board = self.server.owner.board
+
+        json_text = json.dumps(board.cali_board.queue_stats())
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(json_text)))
+        self.end_headers()
+        self.wfile.write(json_text.encode("utf-8"))
+
+    def on_profile(self, queries):
+        try:
+            seconds = float(queries.get("seconds", ["10"])[0])
+            fmt = queries.get("format", ["collapsed"])[0]
+            if fmt not in ("collapsed", "trace"):
+                raise ValueError("unknown format {}".format(fmt))
+            collapsed, trace = Profiler.capture(seconds)
+        except ValueError as ex:
+            self.send_error(http.HTTPStatus.BAD_REQUEST, str(ex))
+            return
+        except Profiler.ProfilerBusy as ex:
+            self.send_error(http.HTTPStatus.CONFLICT, str(ex))
+            return
+
+        if fmt == "trace":
+            body = trace.encode("utf-8")
+            content_type = "application/json;charset=utf-8"
+        else:
+            body = collapsed.encode("utf-8")
+            content_type = "text/plain;charset=utf-8"
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def on_export(self, queries):
+        board = self.server.owner.board
+        try:
+            fmt = queries.get("format", [Store.EXPORT_CSV])[0]
+            chunks = board.store.export(fmt, Store.parse_time(queries.get("from", [None])[0]),
+                                        Store.parse_time(queries.get("to", [None])[0]),
+                                        Store.parse_channels(queries.get("channels", [None])[0]))
+        except ValueError as ex:
+            self.send_error(http.HTTPStatus.BAD_REQUEST, str(ex))
+            return
+
+        content_type = {Store.EXPORT_CSV: "text/csv;charset=utf-8"}.get(fmt, "application/octet-stream")
+        # 分块传输需要 HTTP/1.1, HTTP/1.0 的客户端以关闭连接表示结束. 两种情况导出结束后都关闭连接
+        chunked = self.request_version != "HTTP/1.0"
+        if chunked:
+            self.protocol_version = "HTTP/1.1"
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Disposition", "attachment; filename=elim.{}".format(fmt))
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for chunk in chunks:
+            if chunked:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            else:
+                self.wfile.write(chunk)
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
     @staticmethod
     def number(text):
         text = text.strip()
@@ -142,155 +258,285 @@ class ServerThread(threading.Thread):
     """reads temperature from board"""
 
     def __init__(self, owner):
-        threading.Thread.__init__(self)
+        threading.Thread.__init__(self, name="ServerThread")
         self.owner = owner
-        self.server = HTTPServer(('0.0.0.0', 8902), MyHTTPRequestHandler)
+        # 每个请求一个线程, 读取快照不加锁, 客户端之间互不阻塞
+        self.server = ThreadingHTTPServer(('0.0.0.0', 8902), MyHTTPRequestHandler)
         setattr(self.server, "owner", owner)
+        setattr(self.server, "assets", Assets.AssetCache())
 
     def run(self):
         self.server.serve_forever(poll_interval=0.5)
 
 
+class PolledChannel(object):
+    def __init__(self, name, addr, decode, interval):
+        self.name = name
+        self.addr = addr
+        self.decode = decode
+        self.interval = interval
+        self.next_time = 0
+
+
+class PollingSchedule(object):
+    """ 各寄存器按各自的间隔读取
+
+    elim.conf 的 Measurement 中每一项可以是 false(不读), true(每个 PollingTime 读一次)
+    或者读取间隔的秒数. 慢速通道的起始时刻依次错开一个 PollingTime, 避免挤在同一个周期里.
+    """
+
+    CHANNELS = (
+        # 名称, 寄存器, 解析, 默认是否读取
+        ("Temperature", 0x60, lambda val: dict(zip(('env', 'obj'), (x / 100 for x in val['short']))), True),
+        ("Inf", 0x63, lambda val: {'inf': round(val['float'], 3)}, True),
+        ("Ntc", 0x64, lambda val: {'ntc': val['int']}, True),
+        ("Mv", 0x66, lambda val: {'mv': val['float']}, True),
+        ("Ohm", 0x65, lambda val: {'ohm': val['float']}, True),
+    )
+
+    def __init__(self, measurements, polling_time):
+        self.polling_time = polling_time
+        self.channels = []
+        t = time.time()
+        for name, addr, decode, default in PollingSchedule.CHANNELS:
+            interval = measurements.get(name, default)
+            if interval is False or interval is None:
+                continue
+            if interval is True:
+                interval = polling_time
+            channel = PolledChannel(name, addr, decode, max(float(interval), polling_time))
+            if channel.interval > polling_time:
+                channel.next_time = t + len(self.channels) * polling_time
+            self.channels.append(channel)
+
+    def due(self, t, forced=False):
+        """ 返回此刻该读取的通道. forced 时温度总是被读取 """
+        return [c for c in self.channels if c.next_time <= t + self.polling_time / 2 or (forced and c.addr == 0x60)]
+
+    def done(self, channel, t):
+        channel.next_time += channel.interval
+        if channel.next_time <= t:
+            # 落后太多时不补读, 从现在开始重新计时
+            channel.next_time = t + channel.interval
+
+    def next_time(self):
+        if not self.channels:
+            return time.time() + self.polling_time
+        return min(c.next_time for c in self.channels)
+
+
+class Snapshot(collections.namedtuple("Snapshot", ("seq", "ts") + Store.CHANNELS)):
+    """ 最近的测量数据, 每个通道一列, 不可修改
+
+    BoardThread 每保存一个测量值就发布一个新的快照, 读取者只需读取一次 BoardThread.snapshot 的引用, 不需要加锁
+    """
+    __slots__ = ()
+
+
 class BoardThread(threading.Thread):
     """ """
 
     def __init__(self, owner, polling_time):
-        threading.Thread.__init__(self)
+        threading.Thread.__init__(self, name="BoardThread")
         self.owner = owner
+
+        # 回放录制的串口会话代替真实的板子, Realtime 为 false 时不等待, 用于测试吞吐量
+        transport = None
+        recorder = None
+        self.min_timeout = 0.1
+        self.replay_port = None
+        replay = self.owner.conf.get("Replay")
+        if replay:
+            realtime = replay.get("Realtime", True)
+
+            def transport():
+                self.replay_port = Session.ReplayPort(replay["File"], realtime)
+                return self.replay_port
+            if not realtime:
+                polling_time = 0
+                self.min_timeout = 0
+        elif self.owner.conf.get("Record"):
+            recorder = Session.SessionRecorder(self.owner.conf["Record"])
+
         self.polling_time = polling_time
+        # self.lock 只在写入者之间互斥(轮询和主动上报), 读取者只读 self.snapshot
         self.lock = threading.Lock()
         self.terminate_flag = False
         self.evt = threading.Event()
 
-        self.times = []
-        self.obj_temperatures = []
-        self.env_temperatures = []
-        self.ntc_values = []
-        self.inf_values = []
-        self.ntc_ohms = []
-        self.inf_mvs = []
+        self.columns = {name: collections.deque(maxlen=200) for name in Snapshot._fields[1:]}
+        self.snapshot = Snapshot(0, (), (), (), (), (), (), ())
+        self.data_json = (0, None)
+
+        # 各通道的滚动统计, 与快照一样每次保存测量值后发布一份新的结果
+        self.stats_engine = Stats.StatsEngine(Store.CHANNELS, self.owner.conf.get("StatsWindows", Stats.WINDOWS))
+        self.stats = self.stats_engine.summary()
 
-        measurements = self.owner.conf.get("Measurement", {})
-        self.measure_inf = measurements.get("Inf", True)
-        self.measure_ntc = measurements.get("Ntc", True)
-        self.measure_ohm = measurements.get("Ohm", True)
-        self.measure_mv = measurements.get("Mv", True)
+        self.schedule = PollingSchedule(self.owner.conf.get("Measurement", {}), polling_time)
 
         self.last_measure_time = time.time()
 
-        self.cali_board = Board.CaliBoard()
+        self.store = Store.SampleStore(self.owner.conf.get("Database", "elim.db"))
+
+        # 长时间历史的缩放索引, 从数据库中已有的数据重建, 不阻塞采集
+        self.pyramid = Pyramid.TilePyramid(Store.CHANNELS)
+        threading.Thread(target=self.pyramid.load, args=(self.store, time.time()), daemon=True).start()
+
+        self.cali_board = Board.CaliBoard(transport, recorder)
+
+        # 主动上报模式: 固件支持时由它按 polling_time 发送测量值, 不再逐个寄存器轮询
+        self.push = self.owner.conf.get("Push", False)
+        self.streaming = False
+        self.stream_retry_time = 0
+        self.last_push_time = 0
+        self.cali_board.subscribe(self.on_telemetry)
 
         self.evt.clear()
 
     def shutdown(self):
+        if self.streaming:
+            self.cali_board.stream(0)
         self.cali_board.disconnect()
 
         self.terminate_flag = True
         self.evt.set()
         self.join()
 
+        self.store.close()
+
     def run(self):
         timeout = 0.5
         while not self.terminate_flag:
             self.evt.clear()
-            self.evt.wait(timeout)
+            forced = self.evt.wait(timeout)
             logging.info(f"wake up, evt:{self.evt.is_set()}")
             if self.terminate_flag:
                 break
             self.evt.set()
+            if self.push and not self.streaming:
+                self.start_streaming()
+            if self.streaming:
+                if time.time() - self.last_push_time < self.polling_time * 3 + 1:
+                    timeout = self.polling_time
+                    continue
+                logging.warning("no measurement streamed from the board, fall back to polling")
+                self.streaming = False
+                self.stream_retry_time = time.time() + 60
             logging.info("do something")
-            self.measure()
+            self.measure(forced)
             self.owner.measure_done.emit()
+            if self.replay_port is not None and self.replay_port.finished.is_set():
+                self.replay_finished()
+                break
             logging.info(f"in run last_measure_time {self.last_measure_time}")
             logging.error(f"took {time.time() - self.last_measure_time}s to measure last time")
-            timeout = max(0.1, self.polling_time - (time.time() - self.last_measure_time))
+            timeout = max(self.min_timeout, self.schedule.next_time() - time.time())
             logging.info(f"timeout for next measurement {timeout}")
 
         logging.info("BoardThread ends")
 
+    def replay_finished(self):
+        """ 回放结束后不再轮询, 报告回放期间保存的采样数和速率 """
+        samples = self.snapshot.seq
+        elapsed = self.replay_port.elapsed
+        logging.info(f"replay of {self.replay_port.path} finished: {samples} samples in {elapsed:.3f}s, "
+                        f"{samples / max(elapsed, 1e-6):.1f} samples/s")
+
     def program(self):
-        return self.write_register(0xEE, 00)
+        return self.write_register(0xEE, 00, Board.PRIORITY_BULK)
 
     def unlock(self, key):
         return self.write_register(0xEF, key)
 
-    def measure(self):
-        try:
+    def measure(self, forced=False):
+        with Profiler.span("measure"):
             t = time.time()
             logging.info(f"last_measure_time {t}")
 
-            result = self.read_register(0x60)
-            logging.info("measure 0x60 done")
-            env, obj = result['val']["short"]
-
-            if self.measure_inf:
-                result = self.read_register(0x63)
-                logging.info("measure 0x63 done")
-                inf = round(result['val']["float"], 3)
-            else:
-                inf = 0
-
-            if self.measure_ntc:
-                result = self.read_register(0x64)
-                logging.info("measure 0x64 done")
-                ntc = result['val']["int"]
-            else:
-                ntc = 0
+            values = {}
+            for channel in self.schedule.due(t, forced):
+                try:
+                    with Profiler.span(f"read 0x{channel.addr:02X}"):
+                        result = self.read_register(channel.addr, Board.PRIORITY_REALTIME)
+                    logging.info(f"measure 0x{channel.addr:02X} done")
+                    values.update(channel.decode(result['val']))
+                except Exception as ex:
+                    logging.info(ex, exc_info=True)
+                self.schedule.done(channel, t)
 
-            if self.measure_mv:
-                result = self.read_register(0x66)
-                logging.info("measure 0x66 done")
-                mv = result['val']['float']
-            else:
-                mv = 0
-
-            if self.measure_ohm:
-                result = self.read_register(0x65)
-                logging.info("measure 0x65 done")
-                ohm = result['val']["float"]
-                logging.info(f"ohm: {ohm}")
+            self.last_measure_time = t
 
-            else:
-                ohm = 0
+            if values:
+                with Profiler.span("append"):
+                    self.append_sample(time.time(), values)
 
-            self.last_measure_time = t
+    def append_sample(self, t, values):
+        """ 轮询和主动上报的测量值都经由这里保存, 本次没有测量的通道记为 None """
+        with self.lock:
+            logging.error(f"measure end time: {datetime.datetime.fromtimestamp(t)}")
+            self.columns["ts"].append(t)
+            for channel in Store.CHANNELS:
+                self.columns[channel].append(values.get(channel))
+            # 发布新的快照, 读取者拿到的快照不会再改变
+            self.snapshot = Snapshot(self.snapshot.seq + 1, **{k: tuple(v) for k, v in self.columns.items()})
+            self.stats_engine.add(t, values)
+            self.stats = self.stats_engine.summary()
+
+        # 写入磁盘不占用 self.lock
+        self.store.append(t, values)
+        self.pyramid.append(t, values)
+
+    def history(self, t0, t1, max_points=2000, channels=Store.CHANNELS):
+        """ 返回 t0~t1 之间不超过约 max_points 个点的数据, 每个通道给出 min/max/mean
+
+        点数不多时直接从数据库读取原始数据, 否则从 pyramid 中取合适分辨率的瓦片
+        """
+        if (t1 - t0) / max(self.polling_time, 0.01) > max_points:
+            return self.pyramid.query(t0, t1, max_points, channels)
+        result = {"ts": [], "resolution": 0}
+        columns = [[] for _ in channels]
+        for row in self.store.rows(t0, t1, channels):
+            result["ts"].append(row[0])
+            for column, v in zip(columns, row[1:]):
+                column.append(v)
+        for channel, column in zip(channels, columns):
+            result[channel] = {"min": column, "max": column, "mean": column}
+        return result
 
-            with self.lock:
-                t = time.time()
-                logging.error(f"measure end time: {datetime.datetime.fromtimestamp(t)}")
-                self.times.append(t)
-                self.obj_temperatures.append(obj / 100)
-                self.env_temperatures.append(env / 100)
-                self.inf_values.append(inf)
-                self.ntc_values.append(ntc)
-                self.ntc_ohms.append(ohm)
-                self.inf_mvs.append(mv)
-
-                if len(self.times) > 200:
-                    self.times.pop(0)
-                    self.obj_temperatures.pop(0)
-                    self.env_temperatures.pop(0)
-                    self.inf_values.pop(0)
-                    self.ntc_values.pop(0)
-                    self.ntc_ohms.pop(0)
-                    self.inf_mvs.pop(0)
+    def on_telemetry(self, t, sample, line):
+        """ 串口线程收到固件主动上报的测量值 """
+        if not self.push:
+            return
+        self.last_push_time = t
+        self.append_sample(t, sample)
+        self.owner.measure_done.emit()
 
-        except Exception as ex:
-            logging.info(ex, exc_info=True)
+    def start_streaming(self):
+        if time.time() < self.stream_retry_time:
+            return
+        resp_type, resp_data = self.cali_board.stream(self.polling_time, Board.PRIORITY_REALTIME)
+        if resp_type == Board.RESPONSE_OK:
+            logging.info("the board streams measurements by itself")
+            self.streaming = True
+            self.last_push_time = time.time()
+        else:
+            logging.warning(f"stream is not available: {resp_data}, fall back to polling")
+            self.stream_retry_time = time.time() + 60
 
     @property
     def last_measurement(self):
         logging.info("enter last_measurement")
-        with self.lock:
-            if len(self.times) > 0:
-                t = time.time()
-                if t - self.times[-1] < 0.8:
-                    # 有足够新的数据，直接采用刚刚读取到的树
-                    data = {'obj': self.obj_temperatures[-1], 'env': self.env_temperatures[-1],
-                            'inf': self.inf_values[-1], 'ntc': self.ntc_values[-1], 'ohm': self.ntc_ohms[-1],
-                            'mv': self.inf_mvs[-1], 'tim': str(datetime.datetime.fromtimestamp(self.times[-1]))}
-                    logging.info("leave last_measurement with data")
-                    return data
+        snapshot = self.snapshot
+        if len(snapshot.ts) > 0:
+            t = time.time()
+            if t - snapshot.ts[-1] < 0.8:
+                # 有足够新的数据，直接采用刚刚读取到的树
+                # 各通道的采样周期不同, 取每个通道最近一个非空的值
+                data = {channel: next((v for v in reversed(getattr(snapshot, channel)) if v is not None), None)
+                        for channel in Store.CHANNELS}
+                data['tim'] = str(datetime.datetime.fromtimestamp(snapshot.ts[-1]))
+                logging.info("leave last_measurement with data")
+                return data
         logging.info("leave last_measurement")
         return None
 
@@ -308,12 +554,12 @@ class BoardThread(threading.Thread):
                 data = self.last_measurement
                 return data
 
-    def read_register(self, addr):
+    def read_register(self, addr, priority=Board.PRIORITY_INTERACTIVE):
         result = {}
         error = ""
         for x in range(3):
             try:
-                resp_type, resp_data = self.cali_board.read_register(addr)
+                resp_type, resp_data = self.cali_board.read_register(addr, priority)
                 result['response'] = {Board.RESPONSE_OK: 'ok', Board.RESPONSE_DAT: 'data', Board.RESPONSE_ERR: "error",
                                       Board.RESPONSE_BRN: 'broken'}.get(resp_type)
                 if resp_type == Board.RESPONSE_ERR:
@@ -331,12 +577,12 @@ class BoardThread(threading.Thread):
         logging.info(result)
         return result
 
-    def write_register(self, addr, val):
+    def write_register(self, addr, val, priority=Board.PRIORITY_INTERACTIVE):
         result = {}
         error = ""
         for x in range(3):
             try:
-                resp_type, resp_data = self.cali_board.write_register(addr, val)
+                resp_type, resp_data = self.cali_board.write_register(addr, val, priority)
                 result['response'] = {Board.RESPONSE_OK: 'ok', Board.RESPONSE_DAT: 'data', Board.RESPONSE_ERR: "error",
                                       Board.RESPONSE_BRN: 'broken'}.get(resp_type)
                 if resp_type == Board.RESPONSE_ERR:
@@ -353,12 +599,16 @@ class BoardThread(threading.Thread):
         return result
 
     def data(self):
-        with self.lock:
-            rsp = {"env": copy.copy(self.env_temperatures), "inf": copy.copy(self.inf_values),
-                   "ntc": copy.copy(self.ntc_values), "obj": copy.copy(self.obj_temperatures),
-                   "ohm": copy.copy(self.ntc_ohms), "mv": copy.copy(self.inf_mvs),
-                   "ts": copy.copy(self.times)}
-        return rsp
+        return self.snapshot._asdict()
+
+    def json_data(self):
+        """ 同一个快照只序列化一次, 多个客户端同时轮询时的开销不随客户端数增加 """
+        seq, text = self.data_json
+        snapshot = self.snapshot
+        if seq != snapshot.seq or text is None:
+            text = json.dumps(snapshot._asdict())
+            self.data_json = (snapshot.seq, text)
+        return text
 
     @staticmethod
     def interpret_response_data(resp_data):
@@ -393,6 +643,7 @@ class BoardThread(threading.Thread):
 
 class AppForm(QMainWindow):
     measure_done = pyqtSignal()
+    profile_done = pyqtSignal(str, str)
 
     def __init__(self, parent=None):
         QMainWindow.__init__(self, parent)
@@ -418,6 +669,11 @@ class AppForm(QMainWindow):
         self.add_actions(self.file_menu,
                          (load_file_action, None, quit_action))
 
+        self.debug_menu = self.menuBar().addMenu("&Debug")
+        profile_action = self.create_action("&Profile 10s...", slot=self.on_profile,
+                                            tip="Sample all threads for 10 seconds and save the stacks")
+        self.add_actions(self.debug_menu, (profile_action,))
+
         self.help_menu = self.menuBar().addMenu("&Help")
         about_action = self.create_action("&About",
                                           shortcut='F1', slot=self.on_about,
@@ -439,15 +695,26 @@ class AppForm(QMainWindow):
         self.y_range_1 = None
         self.apply_button = None
 
-        self.text_palette_red = QPalette()
-        self.text_palette_red.setColor(QPalette.ColorRole.Text, QColor(0xFF, 0, 0))
-
-        self.text_palette_blue = QPalette()
-        self.text_palette_blue.setColor(QPalette.ColorRole.Text, QColor(0xFF, 0, 0))
+        # 数值更新后文字由红/蓝逐渐褪成白色, 每一级的调色板预先生成, 动画时只需 setPalette
+        self.fade_palettes_red = AppForm.fade_palettes(QColor(0xFF, 0, 0))
+        self.fade_palettes_blue = AppForm.fade_palettes(QColor(0, 0, 0xFF))
+        self.text_palette_red = self.fade_palettes_red[0]
+        self.text_palette_blue = self.fade_palettes_blue[0]
+        self.fade_step = 0
+        self.fade_timer = QTimer(self)
+        self.fade_timer.timeout.connect(self.on_fade)
 
         self.create_main_frame()
 
-        self.measure_done.connect(self.on_draw)
+        # 采样通知只标记需要重绘, 绘制由 render_timer 合并, 每秒最多 FrameRate 帧
+        self.frame_interval = 1.0 / max(0.1, float(self.conf.get("FrameRate", 5)))
+        self.render_pending = False
+        self.last_frame_time = 0
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.on_frame)
+        self.measure_done.connect(self.on_measure_done)
+        self.profile_done.connect(self.on_profile_done)
 
         self.board = BoardThread(self, self.conf.get("PollingTime", 1))
         self.board.start()
@@ -457,31 +724,77 @@ class AppForm(QMainWindow):
         self.http_thread = ServerThread(self)
         self.http_thread.start()
 
-        self.my_timer = QTimer(self)
-        self.my_timer.timeout.connect(self.my_timer_cb)
-        self.my_timer.start(100)
-        self.update_count = 0
-
-    def my_timer_cb(self):
-        self.update_count += 1
-        if self.update_count > 2:
-            self.update_count = 0
-            clr = self.text_palette_red.color(QPalette.ColorRole.Text)
-            blue = 255 - (255 - clr.blue()) * 0.8
-            green = 255 - (255 - clr.green()) * 0.8
-            clr.setBlue(blue)
-            clr.setGreen(green)
-            self.text_palette_red.setColor(QPalette.ColorRole.Text, clr)
-            self.y_range_0.setPalette(self.text_palette_red)
-
-            clr = self.text_palette_blue.color(QPalette.ColorRole.Text)
-            red = 255 - (255 - clr.red()) * 0.8
-            green = 255 - (255 - clr.green()) * 0.8
-            clr.setRed(red)
-            clr.setGreen(green)
-            self.text_palette_blue.setColor(QPalette.ColorRole.Text, clr)
-            self.y_range_1.setPalette(self.text_palette_blue)
+        # 定时在状态栏报告界面线程的 CPU 占用和帧率
+        self.frame_count = 0
+        self.cpu_sample = (time.time(), time.thread_time(), 0)
+        self.cpu_timer = QTimer(self)
+        self.cpu_timer.timeout.connect(self.on_cpu_timer)
+        self.cpu_timer.start(2000)
 
+    @staticmethod
+    def fade_palettes(color, steps=16):
+        palettes = []
+        for k in range(steps):
+            clr = QColor(*(round(255 - (255 - c) * 0.8 ** k) for c in (color.red(), color.green(), color.blue())))
+            palette = QPalette()
+            palette.setColor(QPalette.ColorRole.Text, clr)
+            palettes.append(palette)
+        return palettes
+
+    def on_fade(self):
+        self.fade_step += 1
+        if self.fade_step >= len(self.fade_palettes_red):
+            self.fade_timer.stop()
+            return
+        self.y_range_0.setPalette(self.fade_palettes_red[self.fade_step])
+        self.y_range_1.setPalette(self.fade_palettes_blue[self.fade_step])
+
+    def start_fade(self):
+        self.fade_step = 0
+        self.y_range_0.setPalette(self.fade_palettes_red[0])
+        self.y_range_1.setPalette(self.fade_palettes_blue[0])
+        self.fade_timer.start(300)
+
+    def on_measure_done(self):
+        self.render_pending = True
+        self.schedule_frame()
+
+    def schedule_frame(self):
+        if not self.render_pending or self.render_timer.isActive():
+            return
+        if self.isMinimized() or not self.isVisible():
+            # 窗口不可见时不绘制, 恢复显示时由 changeEvent/showEvent 补上一帧
+            return
+        delay = self.last_frame_time + self.frame_interval - time.time()
+        self.render_timer.start(max(0, int(delay * 1000)))
+
+    def on_frame(self):
+        if self.isMinimized() or not self.isVisible():
+            return
+        self.render_pending = False
+        self.last_frame_time = time.time()
+        self.frame_count += 1
+        with Profiler.span("draw"):
+            self.on_draw()
+
+    def on_cpu_timer(self):
+        t, cpu, frames = time.time(), time.thread_time(), self.frame_count
+        last_t, last_cpu, last_frames = self.cpu_sample
+        self.cpu_sample = (t, cpu, frames)
+        if t > last_t:
+            share = (cpu - last_cpu) / (t - last_t) * 100
+            fps = (frames - last_frames) / (t - last_t)
+            self.status_text.setText(f"GUI CPU {share:.1f}%, {fps:.1f} fps")
+            logging.info(f"GUI CPU {share:.1f}%, {fps:.1f} fps")
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.schedule_frame()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.schedule_frame()
 
     def closeEvent(self, event) -> None:
         self.board.shutdown()
@@ -498,6 +811,29 @@ class AppForm(QMainWindow):
             self.canvas.print_figure(path, dpi=self.dpi)
             self.statusBar().showMessage('Saved to %s' % path, 2000)
 
+    def on_profile(self):
+        def capture():
+            try:
+                collapsed, trace = Profiler.capture(10)
+            except Profiler.ProfilerBusy as ex:
+                collapsed, trace = "", str(ex)
+            self.profile_done.emit(collapsed, trace)
+
+        threading.Thread(target=capture, name="Profiler", daemon=True).start()
+        self.statusBar().showMessage("Profiling for 10 seconds...", 10000)
+
+    def on_profile_done(self, collapsed, trace):
+        if not collapsed:
+            QMessageBox.warning(self, "Profile", trace)
+            return
+        path, _ = QFileDialog.getSaveFileName(self, 'Save profile', 'elim.folded', "Collapsed stacks (*.folded)")
+        if path:
+            with open(path, "w") as f:
+                f.write(collapsed)
+            with open(path + ".trace.json", "w") as f:
+                f.write(trace)
+            self.statusBar().showMessage('Saved to %s' % path, 2000)
+
     def on_about(self):
         msg = """ A demo of using PyQt with matplotlib:
 
@@ -526,45 +862,98 @@ class AppForm(QMainWindow):
         """ Redraws the figure
         """
         try:
-            # clear the axes and redraw the plot anew
-            #
-            self.axes.clear()
-            # self.axes.grid(self.grid_cb.isChecked())
-
-            # 设置时间轴显示格式
-            # hour_locator = mdates.HourLocator((0, 11, 12,))  # 只显示0、12时
-            minute_locator = mdates.MinuteLocator((0, 20, 40))
-            self.axes.xaxis.set_major_locator(minute_locator)
-            formatter = mdates.ConciseDateFormatter(minute_locator,
-                                                    formats=['%H:%M', '%H:%M', '%H:%M', '%H:%M', '%H:%M',
-                                                             '%H:%M'])  # 显示格式
-            # formatter.formats[3] = '%H'
-            # formatter.zero_formats = [''] + formatter.formats[:-1]
-            self.axes.xaxis.set_major_formatter(formatter)
-            # self.axes.set_ylim(round(self.temperature, 2) - 0.02, round(self.temperature, 2) + 0.02)
-
-            x = []
-            with self.board.lock:
-                for t in self.board.times:
-                    x.append(datetime.datetime.fromtimestamp(t))
-                self.axes.plot(x, self.board.obj_temperatures, ".-", color="red", label="To", linewidth=0.2, ms=0.25)
-                self.axes.plot(x, self.board.env_temperatures, ".-", color="blue", label="Te", linewidth=0.2, ms=0.25)
-
-                self.y_range_0.setText(f"{self.board.obj_temperatures[-1]:.2f}")
-                self.y_range_1.setText(f"{self.board.env_temperatures[-1]:.2f}")
-            self.axes.legend()
-            self.canvas.draw()
-
-            self.update_count = 0
-            self.text_palette_red.setColor(QPalette.ColorRole.Text, QColor(0xFF, 0, 0))
-            self.y_range_0.setPalette(self.text_palette_red)
-            self.text_palette_blue.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0xFF))
-            self.y_range_1.setPalette(self.text_palette_blue)
+            snapshot = self.board.snapshot
+            x = [datetime.datetime.fromtimestamp(t) for t in snapshot.ts]
+            obj_temperatures = snapshot.obj
+            env_temperatures = snapshot.env
+
+            # 不同通道的采样间隔可以不同, 取最近一个有效值
+            obj = next((v for v in reversed(obj_temperatures) if v is not None), None)
+            env = next((v for v in reversed(env_temperatures) if v is not None), None)
+            if obj is not None:
+                self.y_range_0.setText(f"{obj:.2f}")
+            if env is not None:
+                self.y_range_1.setText(f"{env:.2f}")
+
+            # 状态栏显示最短窗口内的噪声和漂移
+            stats = self.board.stats
+            self.pid_text.setText(AppForm.stats_text("To", stats["obj"]))
+            self.range_text.setText(AppForm.stats_text("Te", stats["env"]))
+
+            # 用户缩放/平移历史数据时不跟随最新数据
+            if self.live_check.isChecked() and x:
+                self.clear_bands()
+                self.obj_line.set_data(x, obj_temperatures)
+                self.env_line.set_data(x, env_temperatures)
+                self.updating_view = True
+                try:
+                    self.axes.set_autoscaley_on(True)
+                    self.axes.set_xlim(x[0], x[-1] if len(x) > 1 else x[0] + datetime.timedelta(seconds=1))
+                    self.axes.relim()
+                    self.axes.autoscale_view(scalex=False)
+                finally:
+                    self.updating_view = False
+                self.canvas.draw_idle()
+
+            self.start_fade()
             logging.info("update text")
 
         except Exception as ex:
             logging.error(ex, exc_info=True)
 
+    @staticmethod
+    def stats_text(label, windows):
+        for window, s in windows.items():
+            if s["n"] > 1:
+                return f"{label} {window}: σ {s['std']:.3f}, {s['min']:.2f}~{s['max']:.2f}, " \
+                       f"drift {s['slope'] * 60:+.3f}/min"
+        return ""
+
+    def clear_bands(self):
+        for band in self.bands:
+            band.remove()
+        self.bands = []
+
+    def on_xlim_changed(self, axes):
+        if self.updating_view:
+            return
+        self.live_check.setChecked(False)
+        # 平移时会连续触发, 停下来后再取数据
+        self.zoom_timer.start(100)
+
+    def on_live_changed(self, state):
+        if self.live_check.isChecked():
+            self.on_draw()
+
+    def on_zoom(self):
+        """ 按可见范围从 BoardThread.history 取数据, 每个像素最多一个点 """
+        try:
+            x0, x1 = self.axes.get_xlim()
+            # 图上的时间是本地时间, 按无时区的时间换算回时间戳
+            t0 = mdates.num2date(x0).replace(tzinfo=None).timestamp()
+            t1 = mdates.num2date(x1).replace(tzinfo=None).timestamp()
+            data = self.board.history(t0, t1, max(100, self.canvas.width()), ("obj", "env"))
+            x = [datetime.datetime.fromtimestamp(t) for t in data["ts"]]
+
+            self.clear_bands()
+            self.obj_line.set_data(x, data["obj"]["mean"])
+            self.env_line.set_data(x, data["env"]["mean"])
+            if data["resolution"]:
+                for channel, color in (("obj", "red"), ("env", "blue")):
+                    self.bands.append(self.axes.fill_between(x, data[channel]["min"], data[channel]["max"],
+                                                             color=color, alpha=0.2, linewidth=0))
+            self.updating_view = True
+            try:
+                self.axes.set_autoscaley_on(True)
+                self.axes.relim()
+                self.axes.autoscale_view(scalex=False)
+            finally:
+                self.updating_view = False
+            self.canvas.draw_idle()
+            self.statusBar().showMessage(f"{len(x)} points, resolution {data['resolution'] or 'raw'}", 2000)
+        except Exception as ex:
+            logging.error(ex, exc_info=True)
+
     def create_main_frame(self):
         self.main_frame = QWidget()
 
@@ -583,6 +972,24 @@ class AppForm(QMainWindow):
         #
         self.axes = self.fig.add_subplot(111)
 
+        # 设置时间轴显示格式, 刻度随缩放自动调整
+        locator = mdates.AutoDateLocator()
+        self.axes.xaxis.set_major_locator(locator)
+        self.axes.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+        # 曲线只创建一次, 之后只更新数据
+        self.obj_line, = self.axes.plot([], [], ".-", color="red", label="To", linewidth=0.2, ms=0.25)
+        self.env_line, = self.axes.plot([], [], ".-", color="blue", label="Te", linewidth=0.2, ms=0.25)
+        self.axes.legend()
+        # 缩放历史数据时的 min/max 范围
+        self.bands = []
+
+        self.updating_view = False
+        self.axes.callbacks.connect('xlim_changed', self.on_xlim_changed)
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.timeout.connect(self.on_zoom)
+
         # Bind the 'pick' event for clicking on one of the bars
         #
         self.canvas.mpl_connect('pick_event', self.on_pick)
@@ -608,12 +1015,17 @@ class AppForm(QMainWindow):
         self.y_range_1.setReadOnly(True)
         self.y_range_1.setFont(QFont("Times", 18, QFont.Bold))
 
+        self.live_check = QCheckBox("实时")
+        self.live_check.setChecked(True)
+        self.live_check.setToolTip("跟随最新数据; 缩放或平移后自动取消")
+        self.live_check.stateChanged.connect(self.on_live_changed)
+
         #
         # Layout with box sizers
         #
         hbox = QHBoxLayout()
 
-        for w in [range_label, self.y_range_0, line_label, self.y_range_1]:
+        for w in [range_label, self.y_range_0, line_label, self.y_range_1, self.live_check]:
             hbox.addWidget(w)
             hbox.setAlignment(w, Qt.AlignVCenter)
 
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import collections
+import threading
+import time
+import unittest
+
+import Board
+
+
+class FakeDevice(object):
+    """ 代替串口的假板子, 每条命令耗时 service_time 秒, 读寄存器的应答是 b"reg <地址>" """
+
+    portstr = "fake"
+
+    def __init__(self, service_time=0.005):
+        self.service_time = service_time
+        self.lines = collections.deque()
+        self.commands = 0
+
+    def write(self, data):
+        time.sleep(self.service_time)
+        self.commands += 1
+        if data == Board.command_firmware():
+            reply = Board.encode("fake firmware")
+        else:
+            # command_read_register 以 "$1\r\n" 地址 "\r\n" 结尾
+            reply = Board.encode(b"reg %02x" % data[-3])
+        self.lines.extend(reply.splitlines(True))
+        return len(data)
+
+    @property
+    def in_waiting(self):
+        return len(self.lines)
+
+    def readline(self, size=-1):
+        if not self.lines:
+            time.sleep(0.001)
+            return b""
+        return self.lines.popleft()
+
+    def close(self):
+        pass
+
+
+class SchedulerTest(unittest.TestCase):
+    """ 多个线程以实时优先级不停读取时, 交互命令仍然先于排队的实时命令执行, 批量命令也不会饿死 """
+
+    SECONDS = 2.0
+    FLOODERS = 6
+
+    def setUp(self):
+        self.device = FakeDevice()
+        self.board = Board.CaliBoard(transport=lambda: self.device)
+        self.errors = []
+
+    def tearDown(self):
+        self.board.disconnect()
+
+    def flood(self, stop, addr, priority):
+        while not stop.is_set():
+            rsp = self.board.read_register(addr, priority)
+            if rsp != (Board.RESPONSE_DAT, b"reg %02x" % addr):
+                self.errors.append((addr, rsp))
+
+    def test_interactive_commands_overtake_flood(self):
+        stop = threading.Event()
+        threads = [threading.Thread(target=self.flood, args=(stop, 0x60 + n % 8, Board.PRIORITY_REALTIME))
+                   for n in range(self.FLOODERS)]
+        threads.append(threading.Thread(target=self.flood, args=(stop, 0x70, Board.PRIORITY_BULK)))
+        for thread in threads:
+            thread.start()
+        try:
+            start = time.time()
+            commands = self.device.commands
+            while time.time() - start < self.SECONDS:
+                self.assertEqual(self.board.read_register(0x71), (Board.RESPONSE_DAT, b"reg 71"))
+                time.sleep(0.02)
+            # 实际的每条命令耗时, 包括线程切换, 机器繁忙时会比 FakeDevice.service_time 长
+            service_time = (time.time() - start) / max(self.device.commands - commands, 1)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(self.errors, [])
+        stats = self.board.port.queue_stats()
+        realtime, interactive, bulk = stats["realtime"], stats["interactive"], stats["bulk"]
+        self.assertGreater(interactive["count"], 0)
+        # 交互命令的截止时间早于所有排队的实时命令, 最多等待正在执行的一条和少数截止时间更早的命令
+        self.assertLess(interactive["p95"], max(interactive["budget"], 5 * service_time), stats)
+        self.assertLess(interactive["mean"], realtime["mean"], stats)
+        self.assertGreater(bulk["count"], 0, stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
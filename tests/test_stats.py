@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import math
+import random
+import unittest
+
+import Stats
+
+
+def brute_force(samples, t, seconds):
+    """ 直接由窗口内的全部采样计算 RollingWindow.summary() 的结果 """
+    xs = [(st, sx) for st, sx in samples if st > t - seconds]
+    n = len(xs)
+    if n == 0:
+        return {"n": 0}
+    mean = sum(x for _, x in xs) / n
+    result = {"n": n, "mean": mean, "min": min(x for _, x in xs), "max": max(x for _, x in xs),
+              "std": 0.0, "slope": 0.0}
+    if n > 1:
+        result["std"] = math.sqrt(sum((x - mean) ** 2 for _, x in xs) / (n - 1))
+        tm = sum(st for st, _ in xs) / n
+        d = sum((st - tm) ** 2 for st, _ in xs)
+        if d > 0:
+            result["slope"] = sum((st - tm) * (x - mean) for st, x in xs) / d
+    return result
+
+
+class RollingWindowTest(unittest.TestCase):
+
+    def assertSummaryEqual(self, got, expected, msg):
+        self.assertEqual(got.keys(), expected.keys(), msg)
+        for key, value in expected.items():
+            self.assertTrue(math.isclose(got[key], value, rel_tol=1e-6, abs_tol=1e-6),
+                            "{} {}: {} != {}".format(msg, key, got[key], value))
+
+    def test_empty(self):
+        self.assertEqual(Stats.RollingWindow(10).summary(), {"n": 0})
+
+    def test_single_sample(self):
+        window = Stats.RollingWindow(10)
+        window.add(1.7e9, 36.5)
+        self.assertEqual(window.summary(), {"n": 1, "mean": 36.5, "min": 36.5, "max": 36.5, "std": 0.0, "slope": 0.0})
+
+    def test_young_window_slope(self):
+        # Unix 时间戳的平方和在第一次重新计算累加和之前也不能抵消掉斜率
+        window = Stats.RollingWindow(60)
+        for n in range(5):
+            window.add(1.7e9 + n, 20.0 + 0.5 * n)
+        self.assertAlmostEqual(window.summary()["slope"], 0.5)
+
+    def test_matches_brute_force(self):
+        # 以不规则的间隔加入带漂移和噪声的采样, 数值带一个很大的偏置, 每一步都与直接计算的结果比较
+        rng = random.Random(1)
+        engine = Stats.StatsEngine(("obj", "env"), (1, 10, 60))
+        samples = {"obj": [], "env": []}
+        t = 1.7e9
+        for step in range(2000):
+            t += rng.uniform(0.01, 0.5)
+            values = {"obj": 1000.0 + 0.01 * step + rng.gauss(0, 0.05)}
+            if step % 3:
+                values["env"] = 25.0 + rng.gauss(0, 0.2)
+            engine.add(t, values)
+            for channel, x in values.items():
+                samples[channel].append((t, x))
+            summary = engine.summary()
+            for channel, windows in engine.channels.items():
+                # 窗口随该通道最新的采样移动
+                last = samples[channel][-1][0] if samples[channel] else t
+                for window in windows:
+                    name = "{}s".format(window.seconds)
+                    self.assertSummaryEqual(summary[channel][name], brute_force(samples[channel], last, window.seconds),
+                                            "step {} {} {}".format(step, channel, name))
+
+
+if __name__ == '__main__':
+    unittest.main()